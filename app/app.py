@@ -1,7 +1,22 @@
+import hashlib
+import json
+import sys
+import threading
+import matplotlib
 import pandas as pd
-import matplotlib.pyplot as plt
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from matplotlib.figure import Figure
 from shiny import App, reactive, render, ui
 from functools import lru_cache
+from pathlib import Path
+
+# Plots are only ever rendered to PNG: skip GUI backend detection, and let Agg
+# simplify and chunk long line paths
+matplotlib.use("Agg")
+matplotlib.rcParams["path.simplify"] = True
+matplotlib.rcParams["agg.path.chunksize"] = 10000
 
 try:
     # This will succeed only in the browser (Pyodide)
@@ -10,66 +25,192 @@ try:
 except ImportError:
     IN_BROWSER = False
 
+# Pyodide can't start threads or open sockets; IN_BROWSER only tells whether
+# shinylive's open_url helper is importable, so check the platform directly
+IN_PYODIDE = sys.platform == "emscripten"
+
+# one pooled HTTP session shared by every (possibly concurrent) download
+_session = requests.Session()
+
+try:
+    from platformdirs import user_cache_dir
+    CACHE_DIR = Path(user_cache_dir("shinyapp"))
+except ImportError:
+    CACHE_DIR = Path.home() / ".cache" / "shinyapp"
+
+def _read_table(source, url, usecols=None, dtype=None, **kwargs):
+    """
+    Parse a CSV or Parquet file (picked by the URL suffix) with the given columns and dtypes.
+    """
+    if url.endswith(".parquet"):
+        df = pd.read_parquet(source, columns=usecols, **kwargs)
+        return df.astype({col: t for col, t in (dtype or {}).items() if col in df.columns})
+    return pd.read_csv(source, usecols=usecols, dtype=dtype, **kwargs)
+
+def _download(url, validators):
+    """
+    Conditionally GET a URL through the shared session, revalidating with the
+    cached ETag / Last-Modified. Returns (body, validators); body is None on 304.
+    """
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    response = _session.get(url, headers=headers, timeout=60)
+    if response.status_code == 304:
+        return None, validators
+    response.raise_for_status()
+    return BytesIO(response.content), {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified")
+    }
+
+def _cached_read(url, **kwargs):
+    """
+    Read a data file through an on-disk Parquet cache keyed by the URL and read options.
+    The cached copy is revalidated with the server, so an unchanged file costs a
+    header round-trip instead of a download.
+    """
+    if not url.startswith(("http://", "https://")):
+        # Local files are already on disk
+        return _read_table(url, url, **kwargs)
+    key = hashlib.sha1(f"{url}|{sorted(kwargs.items())!r}".encode()).hexdigest()
+    path = CACHE_DIR / f"{key}.parquet"
+    meta_path = CACHE_DIR / f"{key}.json"
+    validators = {}
+    if path.exists() and meta_path.exists():
+        validators = json.loads(meta_path.read_text())
+    try:
+        body, validators = _download(url, validators)
+    except requests.RequestException:
+        if path.exists():
+            # Offline or server error: serve the last good copy
+            return pd.read_parquet(path)
+        raise
+    if body is None:
+        return pd.read_parquet(path)
+    df = _read_table(body, url, **kwargs)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a crash never leaves a truncated cache entry;
+        # the temp name is per thread since prefetches can write concurrently
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        df.to_parquet(tmp_path, compression="zstd")
+        tmp_path.replace(path)
+        # Validators go last so they never describe an older Parquet file
+        meta_path.write_text(json.dumps(validators))
+    except (ImportError, OSError):
+        # No parquet engine or unwritable cache dir: serve the fresh download
+        pass
+    return df
+
 def read_csv_url(url, **kwargs):
     """
-    Load a CSV either locally or in the browser via Pyodide.
+    Load a CSV or Parquet file either locally or in the browser via Pyodide.
+    Results are memoized per URL and options, so don't modify them in place.
     """
+    # kwargs may hold lists/dicts, so key the cache on their JSON form
+    return _read_csv_url_cached(url, json.dumps(kwargs, sort_keys=True))
+
+@lru_cache(maxsize=32)
+def _read_csv_url_cached(url, kwargs_json):
+    kwargs = json.loads(kwargs_json)
     if IN_BROWSER:
         # Use Pyodide-friendly open_url
         with open_url(url) as f:
-            return pd.read_csv(f, **kwargs)
+            if url.endswith(".parquet"):
+                f = BytesIO(f.read())
+            return _read_table(f, url, **kwargs)
+    elif IN_PYODIDE:
+        # pandas fetches through Pyodide's patched urllib; there's no disk to cache to
+        return _read_table(url, url, **kwargs)
     else:
-        # Normal local read
-        return pd.read_csv(url, **kwargs)
+        # Local read, cached on disk between runs
+        return _cached_read(url, **kwargs)
 if not IN_BROWSER:
     # Hydrologic Timeseries
     river_files = {
-        "Pullayup": "https://uw-psi.github.io/shinyapp/data/Pullayup.csv",
-        "Snohomish": "https://uw-psi.github.io/shinyapp/data/Snohomish.csv",
-        "Green": "https://uw-psi.github.io/shinyapp/data/Green.csv",
-        "Samish": "https://uw-psi.github.io/shinyapp/data/Sammish.csv",
-        "Stillaguamish": "https://uw-psi.github.io/shinyapp/data/Stillaguamish.csv",
-        "Hoko": "https://uw-psi.github.io/shinyapp/data/Hoko.csv",
-        "Elwha": "https://uw-psi.github.io/shinyapp/data/Elwha.csv",
-        "Deschutes": "https://uw-psi.github.io/shinyapp/data/Deschutes.csv",
+        "Pullayup": "https://uw-psi.github.io/shinyapp/data/Pullayup.parquet",
+        "Snohomish": "https://uw-psi.github.io/shinyapp/data/Snohomish.parquet",
+        "Green": "https://uw-psi.github.io/shinyapp/data/Green.parquet",
+        "Samish": "https://uw-psi.github.io/shinyapp/data/Samish.parquet",
+        "Stillaguamish": "https://uw-psi.github.io/shinyapp/data/Stillaguamish.parquet",
+        "Hoko": "https://uw-psi.github.io/shinyapp/data/Hoko.parquet",
+        "Elwha": "https://uw-psi.github.io/shinyapp/data/Elwha.parquet",
+        "Deschutes": "https://uw-psi.github.io/shinyapp/data/Deschutes.parquet",
     }
     velma_files = {
-    "flow2011": "https://uw-psi.github.io/shinyapp/data/velma_monthly_flow_stats_2011.csv",
-    "totC2011": "https://uw-psi.github.io/shinyapp/data/velma_monthly_C_stats_2011.csv"
-    # "temp2011": "https://uw-psi.github.io/shinyapp/data/velma_monthly_temp_stats_2011.csv",
-    # "totN2011": "https://uw-psi.github.io/shinyapp/data/velma_monthly_totN_stats_2011.csv",
+    "flow2011": "https://uw-psi.github.io/shinyapp/data/velma_monthly_flow_stats_2011.parquet",
+    "totC2011": "https://uw-psi.github.io/shinyapp/data/velma_monthly_C_stats_2011.parquet"
+    # "temp2011": "https://uw-psi.github.io/shinyapp/data/velma_monthly_temp_stats_2011.parquet",
+    # "totN2011": "https://uw-psi.github.io/shinyapp/data/velma_monthly_totN_stats_2011.parquet",
     
     }
     lcc_data = {
-    'counties': "https://uw-psi.github.io/shinyapp/data/diffed_counties.csv",
-    'wrias': "https://uw-psi.github.io/shinyapp/data/diffed_wrias.csv",
-    'velma': "https://uw-psi.github.io/shinyapp/data/diffed_velma.csv"
+    'counties': "https://uw-psi.github.io/shinyapp/data/diffed_counties.parquet",
+    'wrias': "https://uw-psi.github.io/shinyapp/data/diffed_wrias.parquet",
+    'velma': "https://uw-psi.github.io/shinyapp/data/diffed_velma.parquet"
     }
 else :
     river_files = {
-        "Pullayup": "data/Pullayup.csv",
-        "Snohomish": "data/Snohomish.csv",
-        "Green": "data/Green.csv",
-        "Samish": "data/Sammish.csv",
-        "Stillaguamish": "data/Stillaguamish.csv",
-        "Hoko": "data/Hoko.csv",
-        "Elwha": "data/Elwha.csv",
-        "Deschutes": "data/Deschutes.csv",
+        "Pullayup": "data/Pullayup.parquet",
+        "Snohomish": "data/Snohomish.parquet",
+        "Green": "data/Green.parquet",
+        "Samish": "data/Samish.parquet",
+        "Stillaguamish": "data/Stillaguamish.parquet",
+        "Hoko": "data/Hoko.parquet",
+        "Elwha": "data/Elwha.parquet",
+        "Deschutes": "data/Deschutes.parquet",
     }
     velma_files = {
-    "flow2011": "data/velma_monthly_flow_stats_2011.csv",
-    "totC2011": "data/velma_monthly_C_stats_2011.csv"
-    # "temp2011": "data/velma_monthly_temp_stats_2011.csv",
-    # "totN2011": "data/velma_monthly_totN_stats_2011.csv",
+    "flow2011": "data/velma_monthly_flow_stats_2011.parquet",
+    "totC2011": "data/velma_monthly_C_stats_2011.parquet"
+    # "temp2011": "data/velma_monthly_temp_stats_2011.parquet",
+    # "totN2011": "data/velma_monthly_totN_stats_2011.parquet",
     }
     lcc_data = {
-    'counties': "data/diffed_counties.csv",
-    'wrias': "data/diffed_wrias.csv",
-    'velma': "data/diffed_velma.csv"
+    'counties': "data/diffed_counties.parquet",
+    'wrias': "data/diffed_wrias.parquet",
+    'velma': "data/diffed_velma.parquet"
     }
 
-sample_df = read_csv_url(river_files["Pullayup"])
-hydro_variable_options = [col for col in sample_df.columns if col not in ("Year", "Day", "Loop", "Step")]
+# variable columns shared by every river file (everything except Year and Day);
+# update this list if the river files gain or lose columns
+hydro_variable_options = [
+    "Variable_Source_Area_Delineated_Average",
+    "Snow(mm/day)_Delineated_Average",
+    "Snow_Melt(mm/day)_Delineated_Average",
+    "Rain(mm/day)_Delineated_Average",
+    "Runoff_All(mm/day)_Delineated_Average",
+    "Runoff_Suface(mm/day)_Delineated_Average",
+    "Air_Temperature(degC)_Delineated_Average",
+    "Min_Air_Temperature(degC)_Delineated_Average",
+    "Max_Air_Temperature(degC)_Delineated_Average",
+    "Ground_Surface_Temperature(degC)_Delineated_Average",
+    "N_in(gN/day/m2)_Delineated_Average",
+    "Grassland_71_agBiomass_Pool(gC)_Cover_Total",
+    "Grassland_71_agBiomass_Pool(gC/m2)_Cover_Average",
+    "Grassland_71_agBiomass_Pool(gC/m2)_Delineated_Average",
+    "EvergreenForest_42_ET(mm*m2/day)_Cover_Total",
+    "EvergreenForest_42_Biomass_Pool(gC)_Cover_Total",
+    "EvergreenForest_42_Biomass_Pool(gC/m2)_Cover_Average",
+    "Wetlands_90_Biomass_Pool(gC/m2)_Delineated_Average"
+]
+
+# only the columns the plots use are read
+hydro_cols = ["Year"] + hydro_variable_options
+lcc_cols = ["Feature_Name", "Year", "Landcover_Class", "diff_dev", "Developable_Area_km2"]
+
+# parse-time dtypes: categorical labels compare/group on int codes, float32 halves memory
+hydro_dtypes = dict.fromkeys(hydro_variable_options, "float32")
+lcc_dtypes = {
+    "Feature_Name": "category",
+    "Landcover_Class": "category",
+    "Developable_Area_km2": "float32",
+    "diff_dev": "float32"
+}
+velma_dtypes = {"Watershed": "category"}
 
 region_type_options = ["County", "WRIA", "VELMA watershed"]
 
@@ -82,20 +223,150 @@ land_cover_colors = {
     "Agriculture": "#FFEBAF"
 }
 
-#cache datasets to avoid redownloading
-@lru_cache
+def reset_figure(fig):
+    """
+    Restore a reused figure's default DPI, size and margins before handing it to
+    render.plot, which scales DPI and size by the client's pixel ratio on every
+    render (so they'd compound) and tight-lays-out from the current margins.
+    """
+    fig.set_dpi(matplotlib.rcParams["figure.dpi"])
+    fig.set_size_inches(matplotlib.rcParams["figure.figsize"])
+    fig.subplots_adjust(**{
+        side: matplotlib.rcParams[f"figure.subplot.{side}"]
+        for side in ("left", "right", "bottom", "top", "wspace", "hspace")
+    })
+    return fig
+
 def load_lcc_dataset(name):
-    return read_csv_url(lcc_data[name])
-
-#####edit here (1 and 2) if you need to make new drop down labels ######
-#1) load data
-df_counties = load_lcc_dataset("counties")
-df_wrias = load_lcc_dataset("wrias")
-df_velma = load_lcc_dataset("velma")
-#2) get unique region names for dropdowns
-county_list = df_counties["Feature_Name"].unique().tolist()
-wria_list = df_wrias["Feature_Name"].unique().tolist()
-velma_list = df_velma["Feature_Name"].unique().tolist()
+    return read_csv_url(lcc_data[name], usecols=lcc_cols, dtype=lcc_dtypes)
+
+def lcc_diff_pivot(df):
+    # min_count/dropna keep classes with no baseline (all-NaN diffs) off the plot
+    return (
+        df.groupby(["Year", "Landcover_Class"], observed=True)["diff_dev"]
+        .sum(min_count=1)
+        .unstack()
+        .dropna(axis=1, how="all")
+        .fillna(0)
+    )
+
+def lcc_area_pivot(df):
+    return df.groupby(["Year", "Landcover_Class"], observed=True)["Developable_Area_km2"].sum().unstack(fill_value=0)
+
+#pivot every region once at load so rendering a plot is just drawing it
+@lru_cache
+def load_lcc_pivots(name):
+    regions = load_lcc_dataset(name).groupby("Feature_Name", observed=True, sort=False)
+    pivots_diff = {region: lcc_diff_pivot(g) for region, g in regions}
+    pivots_area = {region: lcc_area_pivot(g) for region, g in regions}
+    return pivots_diff, pivots_area
+
+#download the three LCC datasets in parallel in the background, so the landcover
+#tab is ready by the time it's opened (import doesn't wait on them)
+if not IN_PYODIDE:
+    _lcc_prefetch = ThreadPoolExecutor(max_workers=3)
+    _lcc_prefetch.map(load_lcc_pivots, lcc_data)
+    _lcc_prefetch.shutdown(wait=False)
+
+#not wired up yet: nothing renders the velma_monthly_plot output, and only the flow
+#file has a Watershed column (the carbon file is keyed by Station)
+@lru_cache
+def load_velma_watersheds(name):
+    df = read_csv_url(velma_files[name], dtype=velma_dtypes)
+    return {watershed: g for watershed, g in df.groupby("Watershed", observed=True, sort=False)}
+
+#yearly min/max/mean of every hydro variable, so switching variables is just a column lookup
+@lru_cache
+def hydro_summary_all(river_name):
+    df = read_csv_url(river_files[river_name], usecols=hydro_cols, dtype=hydro_dtypes)
+    return df.groupby("Year")[hydro_variable_options].agg(["min", "max", "mean"])
+
+#####edit scripts/csv_to_parquet.py and rerun it if you need to make new drop down labels ######
+#unique region names for dropdowns, precomputed so startup doesn't download the datasets
+with open(Path(__file__).parent / "region_names.json") as f:
+    region_names = json.load(f)
+county_list = region_names["counties"]
+wria_list = region_names["wrias"]
+velma_list = region_names["velma"]
+velma_watershed_list = region_names["velma_watersheds"]
+#region type -> LCC dataset name, and the dropdown each region type shows
+region_datasets = {"County": "counties", "VELMA watershed": "velma", "WRIA": "wrias"}
+region_selector_options = {
+    "County": ("Select County", county_list),
+    "VELMA watershed": ("Select VELMA watershed", velma_list),
+    "WRIA": ("Select WRIA", wria_list)
+}
+
+######################## Plots #########################
+# Each builder draws into the given Axes. The cached wrappers keep recently drawn
+# figures, so going back to a region or river already shown skips redrawing;
+# they're shared, so always pass them through reset_figure before rendering.
+# Drawn figures hold MB-scale image buffers, hence the modest cache sizes.
+
+# Unused and untested: no output calls this yet, and it expects a Year column that
+# neither VELMA monthly file has (they hold one year's Monthly_Avg/Min/Max stats)
+def make_velma_plot(watersheds, watershed, variable, ax):
+    df = watersheds[watershed]
+    pivot = df.set_index(["Month", "Year"])[variable].unstack("Year")
+    ax.plot(pivot.index.values, pivot.values, marker='o')
+    ax.set_ylabel(variable)
+    ax.set_xlabel("Month")
+    ax.set_title(f"{variable} in {watershed} Watershed")
+    ax.legend(pivot.columns, title="Year", bbox_to_anchor=(1.05, 1), loc='upper left')
+    return ax
+
+def make_lcc_plot(pivots, region_name, ax):
+    pivot = pivots[region_name]
+    pivot.plot(
+        kind="bar",
+        stacked=True,
+        color=[land_cover_colors.get(c, "#333333") for c in pivot.columns],
+        ax=ax
+    )
+    ax.set_ylabel("Difference in km² from baseline (2015)")
+    ax.set_xlabel("Year")
+    ax.set_title(f"Landcover Change in {region_name}")
+    ax.legend(title="Landcover Class", bbox_to_anchor=(1.05, 1), loc='upper left')
+    return ax
+
+def make_lcc_area_plot(pivots, region_name, ax):
+    pivot = pivots[region_name]
+    pivot.plot(
+        kind="bar",
+        stacked=True,
+        color=[land_cover_colors.get(c, "#333333") for c in pivot.columns],
+        ax=ax
+    )
+    ax.set_ylabel("Developable area in km²")
+    ax.set_xlabel("Year")
+    ax.set_title(f"Landcover Change in {region_name}")
+    ax.legend(title="Landcover Class", bbox_to_anchor=(1.05, 1), loc='upper left')
+    return ax
+
+def make_timeseries_plot(summary, river, variable, ax):
+    ax.plot(summary.index, summary["mean"], label="Mean", color="blue")
+    ax.fill_between(summary.index, summary["min"], summary["max"], color="blue", alpha=0.2, label="Min-Max Range")
+    ax.set_ylabel(variable)
+    ax.set_xlabel("Year")
+    ax.set_title(f"{variable} in {river} River")
+    ax.legend()
+    return ax
+
+# plain Figures rather than pyplot ones, so cached figures never pile up in pyplot
+@lru_cache(maxsize=32)
+def cached_lcc_figure(name, region_name):
+    pivots_diff, _ = load_lcc_pivots(name)
+    return make_lcc_plot(pivots_diff, region_name, Figure().subplots()).figure
+
+@lru_cache(maxsize=32)
+def cached_lcc_area_figure(name, region_name):
+    _, pivots_area = load_lcc_pivots(name)
+    return make_lcc_area_plot(pivots_area, region_name, Figure().subplots()).figure
+
+@lru_cache(maxsize=32)
+def cached_timeseries_figure(river, variable):
+    summary = hydro_summary_all(river)[variable]
+    return make_timeseries_plot(summary, river, variable, Figure().subplots()).figure
 
 ######################## UI #########################
 # The UI section defines the app’s layout and interactive elements.
@@ -141,7 +412,7 @@ app_ui = ui.page_fluid(
                             "totC2011": "Total Carbon"
                         }
                     ),
-                    ui.input_select("velma_watershed", "Select Watershed", choices=read_csv_url(velma_files["flow2011"])["Watershed"].unique().tolist())
+                    ui.input_select("velma_watershed", "Select Watershed", choices=velma_watershed_list)
                 ),
                 ui.layout_columns(
                     ui.card(
@@ -196,69 +467,9 @@ def server(input, output, session):
     ### landcover dashboard fuctions ###
     @render.ui
     def region_selector():
-        if input.region_type() == "County":
-            return ui.input_select("region_name", "Select County", choices=county_list)
-        elif input.region_type() == "VELMA watershed":
-            return ui.input_select("region_name", "Select VELMA watershed", choices=velma_list)
-        else:
-            return ui.input_select("region_name", "Select WRIA", choices=wria_list)
-
-    def make_velma_plot(df, watershed, variable):
-        df = df[df["Watershed"] == watershed]
-        pivot = df.pivot_table(
-            index="Month",
-            columns="Year",
-            values=variable
-        )
-        ax = pivot.plot(
-            kind="line",
-            marker='o'
-        )
-        ax.set_ylabel(variable)
-        ax.set_xlabel("Month")
-        ax.set_title(f"{variable} in {watershed} Watershed")
-        ax.legend(title="Year", bbox_to_anchor=(1.05, 1), loc='upper left')
-        return ax
-    
-    def make_lcc_plot(df, region_name):
-        df = df[df["Feature_Name"] == region_name]
-        pivot = df.pivot_table(
-            index="Year",
-            columns="Landcover_Class",
-            values="diff_dev",
-            fill_value=0
-        )
-        ax = pivot.plot(
-            kind="bar",
-            stacked=True,
-            color=[land_cover_colors.get(c, "#333333") for c in pivot.columns]
-        )
-        ax.set_ylabel("Difference in km² from baseline (2015)")
-        ax.set_xlabel("Year")
-        ax.set_title(f"Landcover Change in {region_name}")
-        ax.legend(title="Landcover Class", bbox_to_anchor=(1.05, 1), loc='upper left')
-        return ax
-    
-    def make_lcc_area_plot(df, region_name):
-        df = df[df["Feature_Name"] == region_name]
-        pivot = df.pivot_table(
-            index="Year",
-            columns="Landcover_Class",
-            values="Developable_Area_km2",
-            aggfunc="sum",
-            fill_value=0
-        )
-        ax = pivot.plot(
-            kind="bar",
-            stacked=True,
-            color=[land_cover_colors.get(c, "#333333") for c in pivot.columns]
-        )
-        ax.set_ylabel("Developable area in km²")
-        ax.set_xlabel("Year")
-        ax.set_title(f"Landcover Change in {region_name}")
-        ax.legend(title="Landcover Class", bbox_to_anchor=(1.05, 1), loc='upper left')
-        return ax
-    
+        label, choices = region_selector_options[input.region_type()]
+        return ui.input_select("region_name", label, choices=choices)
+
     @reactive.Calc
     def selected_region_type():
         """Tracks the currently selected region type."""
@@ -266,46 +477,21 @@ def server(input, output, session):
 
     @reactive.Calc
     def selected_dataset():
-        """Returns the appropriate dataset based on region type."""
-        if selected_region_type() == "County":
-            return load_lcc_dataset("counties")
-        elif selected_region_type() == "VELMA watershed":
-            return load_lcc_dataset("velma")
-        else:
-            return load_lcc_dataset("wrias")
+        """Returns the name of the appropriate dataset based on region type."""
+        return region_datasets[selected_region_type()]
 
     @render.plot
     def plot_lcc():
-        return make_lcc_plot(selected_dataset(), input.region_name())
+        return reset_figure(cached_lcc_figure(selected_dataset(), input.region_name()))
     
     @render.plot
     def plot_lcc_area():
-        return make_lcc_area_plot(selected_dataset(), input.region_name())
+        return reset_figure(cached_lcc_area_figure(selected_dataset(), input.region_name()))
     
     ### VELMA Monthly Explorer functions ###
-    @reactive.Calc
-    def hydro_data():
-        file_path = river_files[input.river()]
-        return read_csv_url(file_path)
-
-    @reactive.Calc
-    def hydro_summary():
-        df = hydro_data()
-        var = input.variable()
-        summary = df.groupby("Year")[var].agg(["min", "max", "mean"]).reset_index()
-        return summary
-
     @render.plot
     def timeseries_plot():
-        df = hydro_summary()
-        fig, ax = plt.subplots()
-        ax.plot(df["Year"], df["mean"], label="Mean", color="blue")
-        ax.fill_between(df["Year"], df["min"], df["max"], color="blue", alpha=0.2, label="Min-Max Range")
-        ax.set_ylabel(input.variable())
-        ax.set_xlabel("Year")
-        ax.set_title(f"{input.variable()} in {input.river()} River")
-        ax.legend()
-        return ax
+        return reset_figure(cached_timeseries_figure(input.river(), input.variable()))
 
 #this line combines the ui and server to create the app
 app = App(app_ui, server)
@@ -0,0 +1,41 @@
+"""
+Convert the CSVs in docs/data to Parquet files that the app loads, and
+refresh the dropdown choices in app/region_names.json.
+
+Run from the repo root whenever a CSV is added or updated:
+    python scripts/csv_to_parquet.py
+"""
+import json
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "docs" / "data"
+REGION_NAMES_PATH = ROOT / "app" / "region_names.json"
+
+# dropdown key -> (source CSV, column whose distinct values are the choices)
+REGION_NAME_SOURCES = {
+    "counties": ("diffed_counties.csv", "Feature_Name"),
+    "wrias": ("diffed_wrias.csv", "Feature_Name"),
+    "velma": ("diffed_velma.csv", "Feature_Name"),
+    "velma_watersheds": ("velma_monthly_flow_stats_2011.csv", "Watershed"),
+}
+
+for csv_path in sorted(DATA_DIR.glob("*.csv")):
+    parquet_path = csv_path.with_suffix(".parquet")
+    table = pa.Table.from_pandas(pd.read_csv(csv_path), preserve_index=False)
+    # Drop the pandas metadata so the files don't depend on the pandas version
+    # that wrote them (the browser build ships an older pandas). Default snappy
+    # compression is readable by every pyarrow build, including Pyodide's.
+    pq.write_table(table.replace_schema_metadata(None), parquet_path)
+    print(f"{csv_path.name} -> {parquet_path.name}")
+
+region_names = {
+    key: pd.read_csv(DATA_DIR / file_name, usecols=[column])[column].unique().tolist()
+    for key, (file_name, column) in REGION_NAME_SOURCES.items()
+}
+REGION_NAMES_PATH.write_text(json.dumps(region_names, indent=2) + "\n")
+print(f"region names -> {REGION_NAMES_PATH.relative_to(ROOT)}")